@@ -1,16 +1,32 @@
 """Employee Dialogue - Flask app to collect, edit, and delete performance review entries."""
 
+import atexit
+import hashlib
+import json
 import logging
 import os
+import secrets
 import smtplib
+import sqlite3
+import threading
+import time
 import uuid
 
+from collections import OrderedDict
 from collections.abc import Callable
+from collections.abc import Collection
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import UTC
 from datetime import datetime
 from email.message import EmailMessage
+from functools import lru_cache
 from functools import wraps
 from typing import Any
+from typing import NamedTuple
+from urllib.parse import urlencode
 from zoneinfo import ZoneInfo
 from zoneinfo import ZoneInfoNotFoundError
 
@@ -19,19 +35,41 @@ import requests
 
 from dotenv import load_dotenv
 from flask import Flask
+from flask import abort
 from flask import flash
 from flask import g
 from flask import has_request_context
+from flask import make_response
 from flask import redirect
 from flask import render_template
 from flask import request
 from flask import session
 from flask import url_for
 from flask_sqlalchemy import SQLAlchemy
+from jinja2 import FileSystemBytecodeCache
+from jinja2.bccache import Bucket
+from requests.adapters import HTTPAdapter
+from sqlalchemy import and_
+from sqlalchemy import event
 from sqlalchemy import func
+from sqlalchemy import insert
 from sqlalchemy import inspect
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import validates
+from sqlalchemy.schema import CreateTable
+from urllib3.util import Retry
 from werkzeug.wrappers.response import Response
 
+try:
+    import fcntl
+except ImportError:  # Windows has no flock; development there runs a single process.
+    fcntl = None
+
 load_dotenv()
 
 app = Flask(__name__)
@@ -39,6 +77,20 @@ app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///app.db"
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "dev-secret-key")
 
+# Compiled templates are shared between worker processes and survive restarts.
+JINJA_CACHE_DIR = os.environ.get("JINJA_CACHE_DIR") or os.path.join(app.instance_path, "jinja-cache")
+
+
+class _LazyBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache that creates its directory on the first template compile."""
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        super().dump_bytecode(bucket)
+
+
+app.jinja_env.bytecode_cache = _LazyBytecodeCache(JINJA_CACHE_DIR)
+
 
 class _RequestIdLogFilter(logging.Filter):
     """Inject request correlation ids into log messages."""
@@ -61,9 +113,48 @@ CLIENT_ID = "64326e78-7c64-4dd1-98d4-6bcfd6936c29"
 TENANT_ID = "b3cd43f7-99bd-4233-8384-6f3a21adeced"
 CLIENT_SECRET = os.environ.get("AZURE_AD_CLIENT_SECRET", "")
 AUTHORITY = f"https://login.microsoftonline.com/{TENANT_ID}"
+LOGOUT_URL = f"{AUTHORITY}/oauth2/v2.0/logout"
 REDIRECT_PATH = "/auth/redirect"
+# Absolute redirect URI registered in Azure AD; without it the URI follows the request host.
+REDIRECT_URI = os.environ.get("AZURE_AD_REDIRECT_URI", "").strip()
 SCOPES = ["User.Read", "Directory.Read.All"]
 
+GRAPH_POOL_MAXSIZE = 16
+
+
+def _build_graph_session() -> requests.Session:
+    """Return a keep-alive session that reuses TLS connections to graph.microsoft.com."""
+
+    graph_session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=GRAPH_POOL_MAXSIZE,
+        max_retries=Retry(total=1, backoff_factor=0),
+    )
+    graph_session.mount("https://", adapter)
+    return graph_session
+
+
+_GRAPH_SESSION = _build_graph_session()
+_GRAPH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="graph")
+GRAPH_CACHE_TTL_SECONDS = 300
+GRAPH_BATCH_URL = "https://graph.microsoft.com/v1.0/$batch"
+# $top=999 is Graph's largest page size; it keeps even large teams to a single page.
+GRAPH_DIRECT_REPORTS_PATH = "/me/directReports?$select=id,displayName,mail,userPrincipalName&$top=999"
+_MANAGER_HIERARCHY_CACHE: dict[str, tuple[float, tuple[str, str]]] = {}
+
+_MSAL_APP: msal.ConfidentialClientApplication | None = None
+_MSAL_APP_LOCK = threading.Lock()
+# Tenant discovery responses, shared so per-user MSAL clients are built without a round trip.
+_MSAL_HTTP_CACHE: dict[Any, Any] = {}
+# Each signed-in user's tokens live in their own cache, keyed by oid; the oldest are evicted.
+TOKEN_CACHE_MAX_USERS = 256
+_TOKEN_CACHES: OrderedDict[str, msal.SerializableTokenCache] = OrderedDict()
+_TOKEN_CACHES_LOCK = threading.Lock()
+_AUTHORIZATION_STATE_PLACEHOLDER = "authorization-state-placeholder"
+# Changes on every restart so cached index pages are revalidated after a deploy.
+_INDEX_ETAG_SALT = uuid.uuid4().hex
+
 SMTP_HOST = os.environ.get("SMTP_HOST", "localhost")
 try:
     SMTP_PORT = int(os.environ.get("SMTP_PORT", "1587"))
@@ -73,9 +164,53 @@ except ValueError:
 SMTP_USERNAME = os.environ.get("SMTP_USERNAME", "")
 SMTP_PASSWORD = os.environ.get("SMTP_PASSWORD", "")
 
-database = SQLAlchemy(app)
+database = SQLAlchemy(app, session_options={"expire_on_commit": False})
+
+SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    # Caps the rows ANALYZE samples when PRAGMA optimize runs on close.
+    "PRAGMA analysis_limit=400",
+)
+SQLITE_PAGE_SIZE = 8192
+
+
+@event.listens_for(Engine, "connect")
+def _configure_sqlite_connection(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Enable WAL journaling and larger page caches on every new SQLite connection."""
+
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_CONNECTION_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+@event.listens_for(Engine, "close")
+def _optimize_sqlite_connection(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Refresh query planner statistics before a SQLite connection is closed."""
+
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+
+    try:
+        dbapi_connection.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        app.logger.warning("PRAGMA optimize failed while closing SQLite connection")
+
 
 SKIP_DB_INIT = os.environ.get("SKIP_DB_INIT", "0") == "1"
+# Bump whenever _initialize_database gains a new migration step.
+SCHEMA_VERSION = 1
+SCHEMA_LOCK_FILENAME = "schema-migration.lock"
 _SCHEMA_READY_CHECKED = False
 
 
@@ -93,6 +228,8 @@ except ZoneInfoNotFoundError:
     GERMAN_TZ = UTC
 
 
+# Entry timestamps are formatted by index() and again by the german_time filter on every view.
+@lru_cache(maxsize=4096)
 def _format_german_time(value: datetime | None) -> str:
     """Format a datetime in German timezone with offset info."""
 
@@ -131,8 +268,59 @@ ABILITY_CHOICES = [
     "N/A",
 ]
 
+# Hashed lookups for validation; the lists above keep the display order for templates.
+OBJECTIVE_CHOICES_SET = frozenset(OBJECTIVE_CHOICES)
+ABILITY_CHOICES_SET = frozenset(ABILITY_CHOICES)
+
 COMMENT_MAX_LENGTH = 1000
 
+ENTRY_FORM_FIELDS = (
+    "objective_rating",
+    "objective_comment",
+    "technical_rating",
+    "project_rating",
+    "methodology_rating",
+    "abilities_comment",
+    "efficiency_collaboration",
+    "efficiency_ownership",
+    "efficiency_resourcefulness",
+    "efficiency_comment",
+    "conduct_mutual_trust",
+    "conduct_proactivity",
+    "conduct_leadership",
+    "conduct_comment",
+    "general_comments",
+    "feedback_received",
+)
+
+ENTRY_ABILITY_FIELDS = (
+    "technical_rating",
+    "project_rating",
+    "methodology_rating",
+    "efficiency_collaboration",
+    "efficiency_ownership",
+    "efficiency_resourcefulness",
+    "conduct_mutual_trust",
+    "conduct_proactivity",
+    "conduct_leadership",
+)
+
+ENTRY_COMMENT_FIELD_LABELS = {
+    "objective_comment": "Objective comments",
+    "abilities_comment": "Abilities comments",
+    "efficiency_comment": "Efficiency comments",
+    "conduct_comment": "Conduct comments",
+    "general_comments": "General comments",
+}
+
+MANAGER_COMMENT_FIELD_LABELS = {
+    "manager_objective_comment": "Manager objective comments",
+    "manager_abilities_comment": "Manager abilities comments",
+    "manager_efficiency_comment": "Manager efficiency comments",
+    "goals_2026": "Goals 2026",
+    "manager_general_comments": "Manager general comments",
+}
+
 STATUS_NOT_CREATED = "not_created_yet"
 STATUS_CREATED = "created"
 STATUS_FINALIZED = "finalized_with_manager"
@@ -163,6 +351,13 @@ STATUS_CLASSES = {
     STATUS_APPROVED: "status-approved",
 }
 
+# Why an owner can no longer edit or delete their self-assessment, keyed by workflow status.
+STATUS_LOCKED_REASONS = {
+    STATUS_FINALIZED: "it has been finalized with manager",
+    STATUS_SUBMITTED: "it has been submitted to the program manager",
+    STATUS_APPROVED: "it has been approved by the program manager",
+}
+
 # Temporary testing override: allow owners to delete entries in any workflow status.
 # Set ALLOW_FINALIZED_DELETE_TESTING=0 (or false/off/no) to disable.
 ALLOW_FINALIZED_SELF_ASSESSMENT_DELETE_FOR_TESTING = (
@@ -176,8 +371,10 @@ class Entry(database.Model):
 
     id = database.Column(database.Integer, primary_key=True)
     name = database.Column(database.String(120), nullable=False)
+    name_lower = database.Column(database.String(120), nullable=False, default="")
     email = database.Column(database.String(120), nullable=False)
     manager_name = database.Column(database.String(120), nullable=True, default="")
+    manager_name_lower = database.Column(database.String(120), nullable=False, default="")
     objective_rating = database.Column(database.String(60), nullable=False)
     objective_comment = database.Column(database.Text, nullable=False)
     manager_objective_comment = database.Column(database.Text, nullable=False, default="")
@@ -200,89 +397,269 @@ class Entry(database.Model):
     manager_general_comments = database.Column(database.Text, nullable=False, default="")
     feedback_received = database.Column(database.String(10), nullable=False, default="")
     program_manager_name = database.Column(database.String(120), nullable=False, default="")
+    program_manager_name_lower = database.Column(
+        database.String(120), nullable=False, default=""
+    )
     workflow_status = database.Column(
         database.String(40), nullable=False, default=STATUS_CREATED
     )
     created_at = database.Column(database.DateTime, default=_utc_now)
     updated_at = database.Column(database.DateTime, default=_utc_now, onupdate=_utc_now)
 
+    __table_args__ = (
+        database.Index("uq_entry_name_lower", name_lower, unique=True),
+        database.Index("ix_entry_mgr_created", manager_name, created_at.desc()),
+        database.Index("ix_entry_pm_status", program_manager_name, workflow_status),
+    )
+
+    @validates("name", "manager_name", "program_manager_name")
+    def _store_name_lower(self, key: str, value: str) -> str:
+        """Keep the lowercase copy of each person-name column in sync with its source."""
+
+        setattr(self, f"{key}_lower", (value or "").lower())
+        return value
 
-def _initialize_database() -> None:
+
+# Entry columns index.html renders; it never shows the manager assessment.
+INDEX_ENTRY_COLUMNS = tuple(
+    column for column in Entry.__table__.columns if column.key not in MANAGER_COMMENT_FIELD_LABELS
+)
+
+
+def _apply_sqlite_page_size(cursor: sqlite3.Cursor) -> None:
+    """Rebuild the database file with SQLITE_PAGE_SIZE pages if it uses a different size."""
+
+    cursor.execute("PRAGMA page_size")
+    if cursor.fetchone()[0] == SQLITE_PAGE_SIZE:
+        return
+
+    # WAL databases keep their page size, so leave WAL while the file is rebuilt.
+    try:
+        cursor.execute("PRAGMA journal_mode=DELETE")
+        cursor.execute(f"PRAGMA page_size={SQLITE_PAGE_SIZE}")
+        cursor.execute("VACUUM")
+    except sqlite3.OperationalError as exc:
+        app.logger.warning("Could not change SQLite page size: %s", exc)
+    finally:
+        # Drain the result row so the statement does not hold the file open for other connections.
+        cursor.execute("PRAGMA journal_mode=WAL").fetchall()
+
+
+ENTRY_ADDED_COLUMNS = (
+    ("name_lower", "TEXT", "''"),
+    ("manager_name", "TEXT", "''"),
+    ("manager_name_lower", "TEXT", "''"),
+    ("objective_rating", "TEXT", "''"),
+    ("objective_comment", "TEXT", "''"),
+    ("manager_objective_comment", "TEXT", "''"),
+    ("technical_rating", "TEXT", "''"),
+    ("project_rating", "TEXT", "''"),
+    ("methodology_rating", "TEXT", "''"),
+    ("abilities_comment", "TEXT", "''"),
+    ("manager_abilities_comment", "TEXT", "''"),
+    ("efficiency_collaboration", "TEXT", "''"),
+    ("efficiency_ownership", "TEXT", "''"),
+    ("efficiency_resourcefulness", "TEXT", "''"),
+    ("efficiency_comment", "TEXT", "''"),
+    ("manager_efficiency_comment", "TEXT", "''"),
+    ("conduct_mutual_trust", "TEXT", "''"),
+    ("conduct_proactivity", "TEXT", "''"),
+    ("conduct_leadership", "TEXT", "''"),
+    ("conduct_comment", "TEXT", "''"),
+    ("general_comments", "TEXT", "''"),
+    ("goals_2026", "TEXT", "''"),
+    ("manager_general_comments", "TEXT", "''"),
+    ("feedback_received", "TEXT", "''"),
+    ("program_manager_name", "TEXT", "''"),
+    ("program_manager_name_lower", "TEXT", "''"),
+    ("workflow_status", "TEXT", f"'{STATUS_CREATED}'"),
+)
+# Person-name columns stored alongside a Python-lowercased copy named ``<column>_lower``.
+LOWERCASED_NAME_COLUMNS = ("name", "manager_name", "program_manager_name")
+# From this many missing columns on, copying into a fresh table beats one ALTER per column.
+ENTRY_REBUILD_MIN_MISSING_COLUMNS = 5
+
+
+def _rebuild_entry_table(cursor: sqlite3.Cursor, existing_cols: set[str]) -> None:
+    """Recreate the entry table from the model and copy the existing rows into it."""
+
+    cursor.execute(
+        "SELECT name FROM sqlite_master "
+        "WHERE type = 'index' AND tbl_name = 'entry' AND sql IS NOT NULL"
+    )
+    for (index_name,) in cursor.fetchall():
+        cursor.execute(f'DROP INDEX "{index_name}"')
+    cursor.execute("ALTER TABLE entry RENAME TO entry_old")
+    cursor.execute(str(CreateTable(Entry.__table__).compile(dialect=database.engine.dialect)))
+
+    defaults = {col_name: default_val for col_name, _, default_val in ENTRY_ADDED_COLUMNS}
+    target_cols: list[str] = []
+    source_exprs: list[str] = []
+    for column in Entry.__table__.columns:
+        if column.name in defaults:
+            default_val = defaults[column.name]
+            if column.name in existing_cols:
+                source_exprs.append(f"COALESCE({column.name}, {default_val})")
+            else:
+                source_exprs.append(default_val)
+        elif column.name in existing_cols:
+            source_exprs.append(column.name)
+        else:
+            continue
+        target_cols.append(column.name)
+
+    cursor.execute(
+        f"INSERT INTO entry ({', '.join(target_cols)}) "
+        f"SELECT {', '.join(source_exprs)} FROM entry_old"
+    )
+    cursor.execute("DROP TABLE entry_old")
+
+
+def _create_owner_name_index(cursor: sqlite3.Cursor) -> None:
+    """Create the unique owner index, refusing to migrate while owners are duplicated."""
+
+    try:
+        cursor.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_entry_name_lower ON entry (name_lower)"
+        )
+    except sqlite3.IntegrityError as exc:
+        # create_entry relies on this index to reject a second self assessment per user.
+        cursor.execute(
+            "SELECT name_lower, COUNT(*) FROM entry GROUP BY name_lower HAVING COUNT(*) > 1"
+        )
+        duplicates = ", ".join(
+            f"{owner or '<blank name>'} ({count} entries)" for owner, count in cursor.fetchall()
+        )
+        raise RuntimeError(
+            "Cannot enforce one entry per user; delete or merge the duplicate entries for "
+            f"{duplicates} and restart"
+        ) from exc
+
+
+def _schema_version() -> int:
+    """Return the schema version recorded in the database's ``user_version``."""
+
+    conn = database.engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA user_version")
+        return cursor.fetchone()[0]
+    finally:
+        conn.close()
+
+
+@contextmanager
+def _schema_migration_lock() -> Iterator[None]:
+    """Hold an exclusive lock file so only one worker process migrates the schema."""
+
+    if fcntl is None:
+        yield
+        return
+
+    os.makedirs(app.instance_path, exist_ok=True)
+    lock_path = os.path.join(app.instance_path, SCHEMA_LOCK_FILENAME)
+    with open(lock_path, "a", encoding="utf-8") as lock_file:
+        # Closing the file releases the lock.
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def _initialize_database(force: bool = False) -> None:
     """Create and migrate schema using lightweight SQLite ALTER logic."""
 
     with app.app_context():
-        conn = database.engine.raw_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(entry)")
-            existing_cols = {row[1] for row in cursor.fetchall()}
-            drop_message = "message" in existing_cols
-
-            if drop_message:
-                cursor.execute("ALTER TABLE entry RENAME TO entry_old")
-                conn.commit()
-
-            database.create_all()
-
-            cursor.execute("PRAGMA table_info(entry)")
-            existing_cols = {row[1] for row in cursor.fetchall()}
-            add_cols = [
-                ("manager_name", "TEXT", "''"),
-                ("objective_rating", "TEXT", "''"),
-                ("objective_comment", "TEXT", "''"),
-                ("manager_objective_comment", "TEXT", "''"),
-                ("technical_rating", "TEXT", "''"),
-                ("project_rating", "TEXT", "''"),
-                ("methodology_rating", "TEXT", "''"),
-                ("abilities_comment", "TEXT", "''"),
-                ("manager_abilities_comment", "TEXT", "''"),
-                ("efficiency_collaboration", "TEXT", "''"),
-                ("efficiency_ownership", "TEXT", "''"),
-                ("efficiency_resourcefulness", "TEXT", "''"),
-                ("efficiency_comment", "TEXT", "''"),
-                ("manager_efficiency_comment", "TEXT", "''"),
-                ("conduct_mutual_trust", "TEXT", "''"),
-                ("conduct_proactivity", "TEXT", "''"),
-                ("conduct_leadership", "TEXT", "''"),
-                ("conduct_comment", "TEXT", "''"),
-                ("general_comments", "TEXT", "''"),
-                ("goals_2026", "TEXT", "''"),
-                ("manager_general_comments", "TEXT", "''"),
-                ("feedback_received", "TEXT", "''"),
-                ("program_manager_name", "TEXT", "''"),
-                ("workflow_status", "TEXT", f"'{STATUS_CREATED}'"),
-            ]
-            for col_name, col_type, default_val in add_cols:
-                if col_name not in existing_cols:
-                    cursor.execute(
-                        "ALTER TABLE entry ADD COLUMN "
-                        f"{col_name} {col_type} NOT NULL DEFAULT {default_val}"
-                    )
+        if _schema_is_current() and not force:
+            return
+        with _schema_migration_lock():
+            # Workers that waited on the lock find the schema the first one migrated.
+            if _schema_is_current() and not force:
+                return
+            _migrate_schema()
+
+
+def _schema_is_current() -> bool:
+    """Return True if no migration is needed, refusing a database written by a newer build."""
+
+    version = _schema_version()
+    if version > SCHEMA_VERSION:
+        # Migrating would rebuild or downgrade tables the newer build already upgraded.
+        raise RuntimeError(
+            f"Database schema version {version} is newer than this build supports "
+            f"({SCHEMA_VERSION}); deploy a build with that schema instead of rolling back"
+        )
+    return version == SCHEMA_VERSION
 
-            cursor.execute(
-                "UPDATE entry SET workflow_status = ? WHERE workflow_status IS NULL OR workflow_status = ''",
-                (STATUS_CREATED,),
-            )
 
-            if drop_message:
+def _migrate_schema() -> None:
+    """Bring the entry table and its indexes up to ``SCHEMA_VERSION``."""
+
+    conn = database.engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        _apply_sqlite_page_size(cursor)
+        database.create_all()
+
+        # Run the whole migration in one transaction so it commits with a single fsync.
+        # IMMEDIATE takes the write lock up front, so a concurrent migrator waits here
+        # instead of failing to upgrade a read lock, and sees the schema this one wrote.
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("PRAGMA table_info(entry)")
+        existing_cols = {row[1] for row in cursor.fetchall()}
+        missing_cols = [col for col in ENTRY_ADDED_COLUMNS if col[0] not in existing_cols]
+        rebuild_table = (
+            "message" in existing_cols
+            or len(missing_cols) >= ENTRY_REBUILD_MIN_MISSING_COLUMNS
+        )
+        if rebuild_table:
+            _rebuild_entry_table(cursor, existing_cols)
+        else:
+            for col_name, col_type, default_val in missing_cols:
                 cursor.execute(
-                    """
-                    INSERT INTO entry (
-                        id, name, email, manager_name, objective_rating,
-                        objective_comment, technical_rating, project_rating,
-                        methodology_rating, created_at, updated_at
-                    )
-                    SELECT
-                        id, name, email, manager_name, objective_rating,
-                        objective_comment, technical_rating, project_rating,
-                        methodology_rating, created_at, updated_at
-                    FROM entry_old
-                    """
+                    "ALTER TABLE entry ADD COLUMN "
+                    f"{col_name} {col_type} NOT NULL DEFAULT {default_val}"
                 )
-                cursor.execute("DROP TABLE entry_old")
-            conn.commit()
-        finally:
-            conn.close()
+
+        # Python's lower() folds non-ASCII letters too, unlike SQLite's lower().
+        for name_col in LOWERCASED_NAME_COLUMNS:
+            cursor.execute(
+                f"SELECT id, {name_col} FROM entry WHERE {name_col}_lower = '' AND {name_col} != ''"
+            )
+            cursor.executemany(
+                f"UPDATE entry SET {name_col}_lower = ? WHERE id = ?",
+                [(entry_name.lower(), entry_id) for entry_id, entry_name in cursor.fetchall()],
+            )
+
+        index_statements = [
+            "CREATE INDEX IF NOT EXISTS ix_entry_mgr_created ON entry (manager_name, created_at DESC)",
+            "CREATE INDEX IF NOT EXISTS ix_entry_pm_status ON entry (program_manager_name, workflow_status)",
+        ]
+        for index_ddl in index_statements:
+            cursor.execute(index_ddl)
+        _create_owner_name_index(cursor)
+
+        cursor.execute(
+            "UPDATE entry SET workflow_status = ? WHERE workflow_status IS NULL OR workflow_status = ''",
+            (STATUS_CREATED,),
+        )
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+        if rebuild_table:
+            # The table copy went through the WAL; fold it into the database file and
+            # shrink the WAL back down instead of leaving it for the next auto-checkpoint.
+            cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        cursor.execute("PRAGMA optimize=0x10002")
+    finally:
+        conn.close()
+
+
+def _dispose_database_engine() -> None:
+    """Close pooled connections at interpreter exit so each runs PRAGMA optimize."""
+
+    with app.app_context():
+        database.engine.dispose()
+
+
+atexit.register(_dispose_database_engine)
 
 
 if not SKIP_DB_INIT:
@@ -304,7 +681,7 @@ def _ensure_schema_ready() -> None:
     app.logger.warning(
         "Database table 'entry' missing at runtime; initializing schema now."
     )
-    _initialize_database()
+    _initialize_database(force=True)
     _SCHEMA_READY_CHECKED = True
 
 
@@ -317,6 +694,14 @@ def _attach_request_id() -> None:
     app.logger.info("Request started method=%s path=%s", request.method, request.path)
 
 
+@app.before_request
+def _load_session_user() -> None:
+    """Read the signed-in user from the session cookie once per request."""
+
+    g.user = session.get("user") or {}
+    g.user_name = g.user.get("name") or ""
+
+
 @app.before_request
 def _prepare_schema_before_request() -> None:
     """Ensure SQLite schema is initialized for this process."""
@@ -353,20 +738,97 @@ def login_required(func: Callable[..., Any]) -> Callable[..., Any]:
     return wrapper
 
 
-def _build_msal_app() -> msal.ConfidentialClientApplication:
-    """Create a MSAL client for auth code flow."""
+def _msal_client(token_cache: msal.TokenCache | None) -> msal.ConfidentialClientApplication:
+    """Return an MSAL client for auth code flow that stores tokens in ``token_cache``."""
 
     return msal.ConfidentialClientApplication(
         CLIENT_ID,
         authority=AUTHORITY,
         client_credential=CLIENT_SECRET or None,
+        token_cache=token_cache,
+        http_cache=_MSAL_HTTP_CACHE,
+    )
+
+
+def _build_msal_app() -> msal.ConfidentialClientApplication:
+    """Return the process-wide MSAL client used to build sign-in URLs, creating it on first use."""
+
+    # Only get_authorization_request_url runs on this client, so its token cache stays empty.
+    global _MSAL_APP
+    if _MSAL_APP is None:
+        with _MSAL_APP_LOCK:
+            if _MSAL_APP is None:
+                _MSAL_APP = _msal_client(None)
+    return _MSAL_APP
+
+
+def _store_user_token_cache(oid: str, token_cache: msal.SerializableTokenCache) -> None:
+    """Keep ``token_cache`` for user ``oid``, evicting the least recently used users."""
+
+    if not oid:
+        return
+    with _TOKEN_CACHES_LOCK:
+        _TOKEN_CACHES[oid] = token_cache
+        _TOKEN_CACHES.move_to_end(oid)
+        while len(_TOKEN_CACHES) > TOKEN_CACHE_MAX_USERS:
+            _TOKEN_CACHES.popitem(last=False)
+
+
+def _user_token_cache(oid: str) -> msal.SerializableTokenCache | None:
+    """Return the token cache stored for user ``oid``, marking it as recently used."""
+
+    with _TOKEN_CACHES_LOCK:
+        token_cache = _TOKEN_CACHES.get(oid)
+        if token_cache is not None:
+            _TOKEN_CACHES.move_to_end(oid)
+        return token_cache
+
+
+@lru_cache(maxsize=1)
+def _authorization_url_template(redirect_uri: str) -> str:
+    """Return the sign-in URL for ``redirect_uri`` with a placeholder in place of the state."""
+
+    return _build_msal_app().get_authorization_request_url(
+        scopes=SCOPES,
+        state=_AUTHORIZATION_STATE_PLACEHOLDER,
+        redirect_uri=redirect_uri,
     )
 
 
+def _authorization_request_url(state: str) -> str:
+    """Return the sign-in URL for ``state``, reusing the template for the redirect URI."""
+
+    template = _authorization_url_template(_redirect_uri())
+    return template.replace(_AUTHORIZATION_STATE_PLACEHOLDER, state)
+
+
+def _acquire_graph_token_silent(session_user: dict[str, Any]) -> str:
+    """Return a Graph access token from the user's MSAL token cache, or "" on a miss.
+
+    The cache only lives in the worker that handled the user's sign-in, so a request on
+    another worker, or after a restart or eviction, misses and the caller re-runs sign-in.
+    """
+
+    username = session_user.get("email") or ""
+    token_cache = _user_token_cache(session_user.get("oid") or "")
+    if not username or token_cache is None:
+        return ""
+
+    msal_client = _msal_client(token_cache)
+    accounts = msal_client.get_accounts(username=username)
+    if not accounts:
+        return ""
+
+    result = msal_client.acquire_token_silent(SCOPES, account=accounts[0])
+    if not result or "access_token" not in result:
+        return ""
+    return result["access_token"]
+
+
 def _redirect_uri() -> str:
     """Return the absolute redirect URI registered in Azure AD."""
 
-    return url_for("authorized", _external=True)
+    return REDIRECT_URI or url_for("authorized", _external=True)
 
 
 def _graph_display_name(data: Any) -> str:
@@ -381,7 +843,7 @@ def _graph_get(url: str, access_token: str) -> requests.Response | None:
     """Issue a Microsoft Graph GET request with standard headers and timeout."""
 
     try:
-        return requests.get(
+        return _GRAPH_SESSION.get(
             url,
             headers={"Authorization": f"Bearer {access_token}"},
             timeout=5,
@@ -428,6 +890,63 @@ def _fetch_program_manager_name(access_token: str, manager_id: Any, manager_name
     return program_manager_name
 
 
+def _graph_payload(response: requests.Response) -> Any:
+    """Return the JSON body of a successful Graph response, or its raw text otherwise."""
+
+    return response.json() if response.status_code == 200 else response.text
+
+
+def _graph_batch(relative_urls: dict[str, str], access_token: str) -> dict[str, tuple[Any, Any]]:
+    """Run several Graph GETs in one $batch request and return (status, body) per request id."""
+
+    payload = {
+        "requests": [
+            {"id": request_id, "method": "GET", "url": url}
+            for request_id, url in relative_urls.items()
+        ]
+    }
+    try:
+        response = _GRAPH_SESSION.post(
+            GRAPH_BATCH_URL,
+            json=payload,
+            headers={"Authorization": f"Bearer {access_token}"},
+            timeout=5,
+        )
+    except Exception:  # pylint: disable=broad-except
+        app.logger.exception("Error while calling Graph URL: %s", GRAPH_BATCH_URL)
+        return {}
+
+    if response.status_code != 200:
+        app.logger.warning("Graph batch request failed: %s", response.text)
+        return {}
+
+    data = response.json()
+    items = data.get("responses", []) if isinstance(data, dict) else []
+    return {
+        item.get("id"): (item.get("status"), item.get("body"))
+        for item in items
+        if isinstance(item, dict)
+    }
+
+
+def _manager_hierarchy_from_payload(
+    access_token: str, status_code: Any, data: Any
+) -> tuple[str, str]:
+    """Return direct manager and organization-head names from a /me/manager result."""
+
+    if status_code == 404:
+        return "", ""
+
+    if status_code != 200:
+        app.logger.warning("Manager lookup failed: %s", data)
+        return "", ""
+
+    manager_name = _graph_display_name(data)
+    manager_id = data.get("id") if isinstance(data, dict) else None
+    program_manager_name = _fetch_program_manager_name(access_token, manager_id, manager_name)
+    return manager_name, program_manager_name
+
+
 def _fetch_manager_hierarchy(access_token: str) -> tuple[str, str]:
     """Return direct manager and organization-head names from Microsoft Graph."""
 
@@ -438,18 +957,81 @@ def _fetch_manager_hierarchy(access_token: str) -> tuple[str, str]:
     if response is None:
         return "", ""
 
-    if response.status_code == 404:
-        return "", ""
+    return _manager_hierarchy_from_payload(
+        access_token, response.status_code, _graph_payload(response)
+    )
 
-    if response.status_code != 200:
-        app.logger.warning("Manager lookup failed: %s", response.text)
-        return "", ""
 
-    data = response.json()
-    manager_name = _graph_display_name(data)
-    manager_id = data.get("id") if isinstance(data, dict) else None
-    program_manager_name = _fetch_program_manager_name(access_token, manager_id, manager_name)
-    return manager_name, program_manager_name
+def _get_cached_manager_hierarchy(user_oid: str, now: float) -> tuple[str, str] | None:
+    """Return the cached manager hierarchy for ``user_oid`` if it is still fresh."""
+
+    cached = _MANAGER_HIERARCHY_CACHE.get(user_oid) if user_oid else None
+    if cached and now - cached[0] < GRAPH_CACHE_TTL_SECONDS:
+        return cached[1]
+    return None
+
+
+def _store_manager_hierarchy(user_oid: str, hierarchy: tuple[str, str], now: float) -> None:
+    """Cache a resolved manager hierarchy and prune expired entries."""
+
+    if not user_oid or not hierarchy[0]:
+        return
+    for cached_oid, (cached_at, _) in list(_MANAGER_HIERARCHY_CACHE.items()):
+        if now - cached_at >= GRAPH_CACHE_TTL_SECONDS:
+            _MANAGER_HIERARCHY_CACHE.pop(cached_oid, None)
+    _MANAGER_HIERARCHY_CACHE[user_oid] = (now, hierarchy)
+
+
+def _direct_reports_page(data: Any) -> tuple[list[dict[str, str]], str]:
+    """Return the direct reports on one Graph result page and the next page URL."""
+
+    if not isinstance(data, dict):
+        return [], ""
+
+    reports: list[dict[str, str]] = []
+    for item in data.get("value", []):
+        if not isinstance(item, dict):
+            continue
+        display_name = _graph_display_name(item)
+        if not display_name:
+            continue
+        reports.append(
+            {
+                "oid": item.get("id") or "",
+                "name": display_name,
+                "email": item.get("mail") or item.get("userPrincipalName") or "",
+            }
+        )
+    return reports, data.get("@odata.nextLink", "")
+
+
+def _direct_reports_from_payload(
+    access_token: str, status_code: Any, data: Any
+) -> list[dict[str, str]]:
+    """Return direct reports sorted by name, following any further result pages."""
+
+    reports: list[dict[str, str]] = []
+    while True:
+        if status_code == 404:
+            return []
+
+        if status_code != 200:
+            app.logger.warning("Direct reports lookup failed: %s", data)
+            break
+
+        page_reports, next_url = _direct_reports_page(data)
+        reports.extend(page_reports)
+        if not next_url:
+            break
+
+        response = _graph_get(next_url, access_token)
+        if response is None:
+            break
+        status_code, data = response.status_code, _graph_payload(response)
+
+    # Stored sorted so index() finds the team rows already in display order.
+    reports.sort(key=lambda report: report["name"].lower())
+    return reports
 
 
 def _fetch_direct_reports(access_token: str) -> list[dict[str, str]]:
@@ -458,47 +1040,42 @@ def _fetch_direct_reports(access_token: str) -> list[dict[str, str]]:
     if not access_token:
         return []
 
-    reports: list[dict[str, str]] = []
-    next_url = (
-        "https://graph.microsoft.com/v1.0/me/directReports"
-        "?$select=id,displayName,mail,userPrincipalName"
-    )
+    response = _graph_get(f"https://graph.microsoft.com/v1.0{GRAPH_DIRECT_REPORTS_PATH}", access_token)
+    if response is None:
+        return []
 
-    while next_url:
-        response = _graph_get(next_url, access_token)
-        if response is None:
-            return reports
+    return _direct_reports_from_payload(access_token, response.status_code, _graph_payload(response))
 
-        if response.status_code == 404:
-            return []
 
-        if response.status_code != 200:
-            app.logger.warning("Direct reports lookup failed: %s", response.text)
-            return reports
-
-        data = response.json()
-        values = data.get("value", []) if isinstance(data, dict) else []
-
-        for item in values:
-            if not isinstance(item, dict):
-                continue
-            display_name = _graph_display_name(item)
-            if not display_name:
-                continue
-            reports.append(
-                {
-                    "oid": item.get("id") or "",
-                    "name": display_name,
-                    "email": item.get("mail") or item.get("userPrincipalName") or "",
-                }
-            )
+def _fetch_sign_in_directory(
+    user_oid: str, access_token: str
+) -> tuple[tuple[str, str], list[dict[str, str]]]:
+    """Return manager hierarchy and direct reports, sending the first lookups as one batch."""
 
-        next_url = data.get("@odata.nextLink", "") if isinstance(data, dict) else ""
+    now = time.monotonic()
+    hierarchy = _get_cached_manager_hierarchy(user_oid, now)
+    if hierarchy is not None or not access_token:
+        return hierarchy or ("", ""), _fetch_direct_reports(access_token)
 
-    return reports
+    batch = _graph_batch(
+        {"manager": "/me/manager", "directReports": GRAPH_DIRECT_REPORTS_PATH}, access_token
+    )
+    # Page through direct reports on a worker while this thread walks the manager chain.
+    if "manager" in batch and "directReports" in batch:
+        reports_future = _GRAPH_EXECUTOR.submit(
+            _direct_reports_from_payload, access_token, *batch["directReports"]
+        )
+        hierarchy = _manager_hierarchy_from_payload(access_token, *batch["manager"])
+    else:
+        reports_future = _GRAPH_EXECUTOR.submit(_fetch_direct_reports, access_token)
+        hierarchy = _fetch_manager_hierarchy(access_token)
+    direct_reports = reports_future.result()
+
+    _store_manager_hierarchy(user_oid, hierarchy, now)
+    return hierarchy, direct_reports
 
 
-def _managed_status(entry: Entry | None) -> str:
+def _managed_status(entry: Entry | Row[Any] | None) -> str:
     """Return status code for a managed self-assessment lifecycle."""
 
     if entry is None:
@@ -510,7 +1087,7 @@ def _managed_status(entry: Entry | None) -> str:
     return STATUS_CREATED
 
 
-def _managed_timestamp(entry: Entry | None) -> str:
+def _managed_timestamp(entry: Entry | Row[Any] | None) -> str:
     """Return a display timestamp for managed row state changes."""
 
     if entry and entry.updated_at:
@@ -518,47 +1095,152 @@ def _managed_timestamp(entry: Entry | None) -> str:
     return "N/A"
 
 
-@app.route("/")
-@login_required
-def index() -> str:
-    """List all entries sorted by creation time."""
-    session_user = session.get("user", {})
-    name = session_user.get("name", "")
-    program_manager_name = session_user.get("program_manager_name", "")
-    is_program_manager = bool(name and program_manager_name and name == program_manager_name)
-    raw_refreshed_at = session_user.get("direct_reports_refreshed_at")
-    if isinstance(raw_refreshed_at, str):
-        try:
-            team_refreshed_at = _format_german_time(datetime.fromisoformat(raw_refreshed_at))
-        except ValueError:
-            team_refreshed_at = raw_refreshed_at
-    else:
-        team_refreshed_at = "N/A"
-    own_entries = (
-        Entry.query.filter(func.lower(Entry.name) == name.lower())
-        .order_by(Entry.created_at.desc())
-        .all()
-        if name
-        else []
-    )
+class ManagedRow(NamedTuple):
+    """One row of the team table on the index page."""
 
-    managed_entries = (
-        Entry.query.filter(Entry.manager_name == name, Entry.name != name)
-        .order_by(Entry.created_at.desc())
-        .all()
-        if name
-        else []
+    member_name: str
+    member_email: str
+    member_oid: str
+    entry: Row[Any] | None
+    status_code: str
+    status_label: str
+    status_tooltip: str
+    status_class: str
+    timestamp_label: str
+
+
+def _managed_row(
+    member_name: str, member_email: str, member_oid: str, entry: Row[Any] | None
+) -> ManagedRow:
+    """Return one team-table row for a team member and their entry, if any."""
+
+    # _managed_status only returns known codes, so the status tables need no defaults.
+    status_code = _managed_status(entry)
+    return ManagedRow(
+        member_name=member_name,
+        member_email=member_email,
+        member_oid=member_oid,
+        entry=entry,
+        status_code=status_code,
+        status_label=STATUS_LABELS[status_code],
+        status_tooltip=STATUS_TOOLTIPS[status_code],
+        status_class=STATUS_CLASSES[status_code],
+        timestamp_label=_managed_timestamp(entry),
     )
 
-    program_manager_entries = (
-        Entry.query.filter(
-            Entry.program_manager_name == name,
-            Entry.workflow_status.in_([STATUS_SUBMITTED, STATUS_APPROVED]),
+
+def _managed_entry_lookup(managed_entries: list[Row[Any]]) -> dict[str, Row[Any]]:
+    """Return managed entries keyed by both lowercased email and lowercased name."""
+
+    lookup: dict[str, Row[Any]] = {}
+    for entry in managed_entries:
+        if entry.name_lower.strip():
+            lookup[entry.name_lower] = entry
+    # Emails go in last so they win the (unlikely) clash with a name spelled like an email.
+    for entry in managed_entries:
+        email_key = (entry.email or "").lower()
+        if email_key.strip():
+            lookup[email_key] = entry
+    return lookup
+
+
+def _team_refreshed_label(raw_refreshed_at: Any) -> str:
+    """Return the display time of the last direct-reports refresh stored in the session."""
+
+    if not isinstance(raw_refreshed_at, str):
+        return "N/A"
+    try:
+        return _format_german_time(datetime.fromisoformat(raw_refreshed_at))
+    except ValueError:
+        return raw_refreshed_at
+
+
+def _index_visibility_filter(name: str, is_program_manager: bool) -> Any:
+    """Return the filter selecting every entry shown on the index page for ``name``."""
+
+    visibility_filters = [
+        Entry.name_lower == name.lower(),
+        and_(Entry.manager_name == name, Entry.name != name),
+    ]
+    if is_program_manager:
+        visibility_filters.append(
+            and_(
+                Entry.program_manager_name == name,
+                Entry.workflow_status.in_((STATUS_SUBMITTED, STATUS_APPROVED)),
+            )
         )
+    return or_(*visibility_filters)
+
+
+def _index_etag(session_user: dict[str, Any], name: str, is_program_manager: bool) -> str:
+    """Return an ETag covering the session user and the entries the index page shows."""
+
+    entry_version: tuple[Any, ...] = (0, None)
+    if name:
+        entry_version = tuple(
+            database.session.query(func.count(Entry.id), func.max(Entry.updated_at))
+            .filter(_index_visibility_filter(name, is_program_manager))
+            .one()
+        )
+    fingerprint = json.dumps(
+        [_INDEX_ETAG_SALT, session_user, entry_version], sort_keys=True, default=str
+    )
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+def _load_index_entries(
+    name: str, is_program_manager: bool
+) -> tuple[list[Row[Any]], list[Row[Any]], list[Row[Any]]]:
+    """Return own, managed and program-manager entry rows from a single query."""
+
+    if not name:
+        return [], [], []
+
+    name_lower = name.lower()
+    program_manager_statuses = (STATUS_SUBMITTED, STATUS_APPROVED)
+
+    own_entries: list[Row[Any]] = []
+    managed_entries: list[Row[Any]] = []
+    program_manager_entries: list[Row[Any]] = []
+    # Plain rows skip ORM instance construction; index() only reads column values.
+    visible_entries = database.session.execute(
+        select(*INDEX_ENTRY_COLUMNS)
+        .where(_index_visibility_filter(name, is_program_manager))
         .order_by(Entry.created_at.desc())
-        .all()
-        if is_program_manager
-        else []
+        .execution_options(yield_per=100)
+    )
+    for entry in visible_entries:
+        if entry.name_lower == name_lower:
+            own_entries.append(entry)
+        if entry.manager_name == name and entry.name != name:
+            managed_entries.append(entry)
+        if (
+            is_program_manager
+            and entry.program_manager_name == name
+            and entry.workflow_status in program_manager_statuses
+        ):
+            program_manager_entries.append(entry)
+    return own_entries, managed_entries, program_manager_entries
+
+
+@app.route("/")
+@login_required
+def index() -> Response:
+    """List all entries sorted by creation time."""
+    session_user = g.user
+    name = g.user_name
+    program_manager_name = session_user.get("program_manager_name", "")
+    is_program_manager = bool(name and program_manager_name and name == program_manager_name)
+    # Pending flash messages are rendered once, so that page must not be revalidated.
+    etag = "" if "_flashes" in session else _index_etag(session_user, name, is_program_manager)
+    if etag and request.if_none_match.contains(etag):
+        not_modified = make_response("", 304)
+        not_modified.set_etag(etag)
+        return not_modified
+
+    team_refreshed_at = _team_refreshed_label(session_user.get("direct_reports_refreshed_at"))
+    own_entries, managed_entries, program_manager_entries = _load_index_entries(
+        name, is_program_manager
     )
 
     own_entry = own_entries[0] if own_entries else None
@@ -567,80 +1249,36 @@ def index() -> str:
         direct_reports = []
 
     own_status_code = _managed_status(own_entry)
-    own_status_label = STATUS_LABELS.get(own_status_code, STATUS_LABELS[STATUS_CREATED])
-    own_status_tooltip = STATUS_TOOLTIPS.get(own_status_code, "")
+    own_status_label = STATUS_LABELS[own_status_code]
+    own_status_tooltip = STATUS_TOOLTIPS[own_status_code]
     own_timestamp_label = _managed_timestamp(own_entry)
 
-    managed_by_email = {
-        (entry.email or "").lower(): entry for entry in managed_entries if (entry.email or "").strip()
-    }
-    managed_by_name = {
-        (entry.name or "").lower(): entry for entry in managed_entries if (entry.name or "").strip()
-    }
+    managed_lookup = _managed_entry_lookup(managed_entries)
 
-    managed_rows: list[dict[str, Any]] = []
+    managed_rows: list[ManagedRow] = []
     seen_entry_ids: set[int] = set()
 
     for report in direct_reports:
         report_name = report.get("name", "")
         report_email = report.get("email", "")
         report_oid = report.get("oid", "")
-        entry = managed_by_email.get(report_email.lower()) or managed_by_name.get(report_name.lower())
-        status_code = _managed_status(entry)
+        entry = managed_lookup.get(report_email.lower()) or managed_lookup.get(report_name.lower())
         if entry:
             seen_entry_ids.add(entry.id)
-
-        managed_rows.append(
-            {
-                "member_name": report_name,
-                "member_email": report_email,
-                "member_oid": report_oid,
-                "entry": entry,
-                "status_code": status_code,
-                "status_label": STATUS_LABELS.get(status_code, STATUS_LABELS[STATUS_CREATED]),
-                "status_tooltip": STATUS_TOOLTIPS.get(status_code, ""),
-                "status_class": STATUS_CLASSES.get(status_code, "status-created"),
-                "timestamp_label": _managed_timestamp(entry),
-            }
-        )
+        managed_rows.append(_managed_row(report_name, report_email, report_oid, entry))
 
     for entry in managed_entries:
         if entry.id in seen_entry_ids:
             continue
-        status_code = _managed_status(entry)
-        managed_rows.append(
-            {
-                "member_name": entry.name,
-                "member_email": entry.email,
-                "member_oid": "",
-                "entry": entry,
-                "status_code": status_code,
-                "status_label": STATUS_LABELS.get(status_code, STATUS_LABELS[STATUS_CREATED]),
-                "status_tooltip": STATUS_TOOLTIPS.get(status_code, ""),
-                "status_class": STATUS_CLASSES.get(status_code, "status-created"),
-                "timestamp_label": _managed_timestamp(entry),
-            }
-        )
+        managed_rows.append(_managed_row(entry.name, entry.email, "", entry))
 
     for entry in program_manager_entries:
         if entry.id in seen_entry_ids:
             continue
-        status_code = _managed_status(entry)
-        managed_rows.append(
-            {
-                "member_name": entry.name,
-                "member_email": entry.email,
-                "member_oid": "",
-                "entry": entry,
-                "status_code": status_code,
-                "status_label": STATUS_LABELS.get(status_code, STATUS_LABELS[STATUS_CREATED]),
-                "status_tooltip": STATUS_TOOLTIPS.get(status_code, ""),
-                "status_class": STATUS_CLASSES.get(status_code, "status-created"),
-                "timestamp_label": _managed_timestamp(entry),
-            }
-        )
+        managed_rows.append(_managed_row(entry.name, entry.email, "", entry))
 
-    managed_rows.sort(key=lambda row: (row.get("member_name") or "").lower())
+    # Team rows arrive pre-sorted, so this mostly merges in the few extra entry rows.
+    managed_rows.sort(key=lambda row: (row.member_name or "").lower())
 
     app.logger.info(
         "Loaded index for user=%s own_entries=%s managed_entries=%s program_manager_entries=%s",
@@ -650,47 +1288,94 @@ def index() -> str:
         len(program_manager_entries),
     )
 
-    return render_template(
-        "index.html",
-        own_entries=own_entries,
-        managed_entries=managed_entries,
-        managed_rows=managed_rows,
-        objective_choices=OBJECTIVE_CHOICES,
-        ability_choices=ABILITY_CHOICES,
-        has_own_entry=bool(own_entry),
-        current_name=name,
-        team_refreshed_at=team_refreshed_at,
-        is_program_manager=is_program_manager,
-        own_status_code=own_status_code,
-        own_status_label=own_status_label,
-        own_status_tooltip=own_status_tooltip,
-        own_timestamp_label=own_timestamp_label,
-        own_status_class=STATUS_CLASSES.get(own_status_code, "status-created"),
-        status_not_created=STATUS_NOT_CREATED,
-        status_created=STATUS_CREATED,
-        status_finalized=STATUS_FINALIZED,
-        status_submitted=STATUS_SUBMITTED,
-        status_approved=STATUS_APPROVED,
-        status_classes=STATUS_CLASSES,
-        allow_finalized_delete_testing=ALLOW_FINALIZED_SELF_ASSESSMENT_DELETE_FOR_TESTING,
+    response = make_response(
+        render_template(
+            "index.html",
+            own_entries=own_entries,
+            managed_entries=managed_entries,
+            managed_rows=managed_rows,
+            objective_choices=OBJECTIVE_CHOICES,
+            ability_choices=ABILITY_CHOICES,
+            has_own_entry=bool(own_entry),
+            current_name=name,
+            team_refreshed_at=team_refreshed_at,
+            is_program_manager=is_program_manager,
+            own_status_code=own_status_code,
+            own_status_label=own_status_label,
+            own_status_tooltip=own_status_tooltip,
+            own_timestamp_label=own_timestamp_label,
+            own_status_class=STATUS_CLASSES[own_status_code],
+            status_not_created=STATUS_NOT_CREATED,
+            status_created=STATUS_CREATED,
+            status_finalized=STATUS_FINALIZED,
+            status_submitted=STATUS_SUBMITTED,
+            status_approved=STATUS_APPROVED,
+            status_classes=STATUS_CLASSES,
+            allow_finalized_delete_testing=ALLOW_FINALIZED_SELF_ASSESSMENT_DELETE_FOR_TESTING,
+        )
     )
+    if etag:
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _see_other(location: str) -> Response:
+    """Answer a POST with a bodyless 303 so the browser follows up with a GET."""
+
+    return Response(status=303, headers={"Location": location})
+
+
+def _redirect_after_request(location: str) -> Response:
+    """Redirect to ``location`` with a 303 after a POST and Flask's usual 302 otherwise."""
+
+    return _see_other(location) if request.method == "POST" else redirect(location)
 
 
 @app.route("/team/refresh", methods=["POST"])
 @login_required
 def refresh_team_members() -> Response:
-    """Refresh managed team members by re-running sign-in flow."""
+    """Refresh managed team members, re-running sign-in only when no cached token exists."""
 
-    session_user = session.get("user", {})
+    session_user = g.user
     app.logger.info(
         "Team refresh requested by user=%s oid=%s",
         session_user.get("name") or "unknown",
         session_user.get("oid") or "",
     )
 
+    access_token = _acquire_graph_token_silent(session_user)
+    if access_token:
+        direct_reports = _fetch_direct_reports(access_token)
+        session["user"] = {
+            **session_user,
+            "direct_reports": direct_reports,
+            "direct_reports_refreshed_at": _utc_now().isoformat(),
+        }
+        app.logger.info(
+            "Team members refreshed with cached token user=%s direct_reports=%s",
+            session_user.get("name") or "unknown",
+            len(direct_reports),
+        )
+        flash("Team members refreshed from Microsoft Entra.", "success")
+        return _see_other(url_for("index"))
+
     session["post_login_redirect"] = url_for("index")
     flash("Refreshing team members from Microsoft Entra...", "info")
-    return redirect(url_for("login", next=url_for("index")))
+    return _see_other(url_for("login", next=url_for("index")))
+
+
+def _own_entry_id(name: str) -> int | None:
+    """Return the id of the entry owned by ``name`` without loading the row."""
+
+    if not name:
+        return None
+    return (
+        database.session.query(Entry.id)
+        .filter(Entry.name_lower == name.lower())
+        .limit(1)
+        .scalar()
+    )
 
 
 @app.route("/entries/new", methods=["GET"])
@@ -698,20 +1383,17 @@ def refresh_team_members() -> Response:
 def new_entry() -> str | Response:
     """Display the creation form, redirecting to edit if an entry exists."""
 
-    session_user = session.get("user", {})
-    name = session_user.get("name", "")
+    name = g.user_name
 
-    existing_entry = (
-        Entry.query.filter(func.lower(Entry.name) == name.lower()).first() if name else None
-    )
-    if existing_entry:
+    existing_entry_id = _own_entry_id(name)
+    if existing_entry_id is not None:
         app.logger.info(
             "User=%s requested new entry but existing entry_id=%s found; redirecting to edit",
             name or "unknown",
-            existing_entry.id,
+            existing_entry_id,
         )
         flash("You already have an entry. Redirected to edit.", "info")
-        return redirect(url_for("edit_entry", entry_id=existing_entry.id))
+        return redirect(url_for("edit_entry", entry_id=existing_entry_id))
 
     app.logger.info("Rendering new entry form for user=%s", name or "unknown")
 
@@ -722,7 +1404,7 @@ def new_entry() -> str | Response:
     )
 
 
-def _validate_choice(value: str, choices: list[str]) -> bool:
+def _validate_choice(value: str, choices: Collection[str]) -> bool:
     """Return True if value is one of the allowed choices."""
 
     return value in choices
@@ -734,6 +1416,34 @@ def _find_too_long_text_fields(fields: dict[str, str]) -> list[str]:
     return [label for label, value in fields.items() if len(value) > COMMENT_MAX_LENGTH]
 
 
+def _read_form_fields(fields: Iterable[str]) -> dict[str, str]:
+    """Return stripped form values keyed by field name, defaulting to an empty string."""
+
+    form_data = dict.fromkeys(fields, "")
+    form_data.update(
+        (field, value.strip()) for field, value in request.form.items() if field in form_data
+    )
+    return form_data
+
+
+def _entry_form_is_valid(form_data: dict[str, str]) -> bool:
+    """Return True if every self-assessment field is filled with a valid option."""
+
+    if not all(form_data[field] for field in ENTRY_FORM_FIELDS):
+        return False
+    if not _validate_choice(form_data["objective_rating"], OBJECTIVE_CHOICES_SET):
+        return False
+    return ABILITY_CHOICES_SET.issuperset(form_data[field] for field in ENTRY_ABILITY_FIELDS)
+
+
+def _too_long_comment_labels(form_data: dict[str, str], labels: dict[str, str]) -> list[str]:
+    """Return labels of the labelled comment fields exceeding COMMENT_MAX_LENGTH."""
+
+    return _find_too_long_text_fields(
+        {label: form_data[field] for field, label in labels.items()}
+    )
+
+
 def _can_access_entry(entry: Entry, session_user: dict[str, Any]) -> bool:
     """Return True if session user owns the entry (manager-only access is denied)."""
 
@@ -751,6 +1461,51 @@ def _can_manage_entry(entry: Entry, session_user: dict[str, Any]) -> bool:
     return bool(session_name and manager_name and session_name == manager_name)
 
 
+def _entry_for_user_or_404(
+    entry_id: int,
+    session_user: dict[str, Any],
+    action: str,
+    name_filter: Callable[[str], Any],
+) -> Entry:
+    """Return the entry matching ``name_filter`` for the session user, otherwise abort with 404."""
+
+    name = session_user.get("name") or ""
+    entry = (
+        database.session.scalar(select(Entry).where(Entry.id == entry_id, name_filter(name)))
+        if name
+        else None
+    )
+    if entry is None:
+        app.logger.warning("%s denied entry_id=%s requester=%s", action, entry_id, name or "unknown")
+        abort(404)
+    return entry
+
+
+def _locked_entry_message(action: str, workflow_status: str) -> str:
+    """Return the flash message for an owner ``action`` blocked by ``workflow_status``."""
+
+    reason = STATUS_LOCKED_REASONS.get(workflow_status)
+    if reason is None:
+        return f"Cannot {action} this self-assessment at this stage."
+    return f"Cannot {action} this self-assessment because {reason}."
+
+
+def _owned_entry_or_404(entry_id: int, session_user: dict[str, Any], action: str) -> Entry:
+    """Return the entry owned by the session user, otherwise abort with 404."""
+
+    return _entry_for_user_or_404(
+        entry_id, session_user, action, lambda name: Entry.name_lower == name.lower()
+    )
+
+
+def _managed_entry_or_404(entry_id: int, session_user: dict[str, Any], action: str) -> Entry:
+    """Return the entry managed by the session user, otherwise abort with 404."""
+
+    return _entry_for_user_or_404(
+        entry_id, session_user, action, lambda name: Entry.manager_name_lower == name.lower()
+    )
+
+
 def _can_approve_entry(entry: Entry, session_user: dict[str, Any]) -> bool:
     """Return True if session user is the designated program manager."""
 
@@ -897,85 +1652,22 @@ def _send_assessment_summary_email(entry: Entry, manager_email: str = "") -> Non
 @login_required
 def create_entry() -> Response:
     """Create a new entry from form data."""
-    session_user = session.get("user", {})
-    name = session_user.get("name", "")
+    session_user = g.user
+    name = g.user_name
     email = session_user.get("email", "")
     manager_name = session_user.get("manager_name", "").strip()
-    objective_rating = request.form.get("objective_rating", "").strip()
-    objective_comment = request.form.get("objective_comment", "").strip()
-    technical_rating = request.form.get("technical_rating", "").strip()
-    project_rating = request.form.get("project_rating", "").strip()
-    methodology_rating = request.form.get("methodology_rating", "").strip()
-    abilities_comment = request.form.get("abilities_comment", "").strip()
-    efficiency_collaboration = request.form.get("efficiency_collaboration", "").strip()
-    efficiency_ownership = request.form.get("efficiency_ownership", "").strip()
-    efficiency_resourcefulness = request.form.get("efficiency_resourcefulness", "").strip()
-    efficiency_comment = request.form.get("efficiency_comment", "").strip()
-    conduct_mutual_trust = request.form.get("conduct_mutual_trust", "").strip()
-    conduct_proactivity = request.form.get("conduct_proactivity", "").strip()
-    conduct_leadership = request.form.get("conduct_leadership", "").strip()
-    conduct_comment = request.form.get("conduct_comment", "").strip()
-    general_comments = request.form.get("general_comments", "").strip()
-    feedback_received = request.form.get("feedback_received", "").strip()
-
-    base_missing = not name or not email
-    objective_missing = not objective_rating or not objective_comment
-    abilities_missing = (
-        not technical_rating
-        or not project_rating
-        or not methodology_rating
-        or not abilities_comment
-        or not efficiency_collaboration
-        or not efficiency_ownership
-        or not efficiency_resourcefulness
-        or not efficiency_comment
-        or not conduct_mutual_trust
-        or not conduct_proactivity
-        or not conduct_leadership
-        or not conduct_comment
-        or not general_comments
-        or not feedback_received
-    )
-    objective_invalid = not _validate_choice(objective_rating, OBJECTIVE_CHOICES)
-    abilities_invalid = not all(
-        _validate_choice(val, ABILITY_CHOICES)
-        for val in (
-            technical_rating,
-            project_rating,
-            methodology_rating,
-            efficiency_collaboration,
-            efficiency_ownership,
-            efficiency_resourcefulness,
-            conduct_mutual_trust,
-            conduct_proactivity,
-            conduct_leadership,
-        )
-    )
+    form_data = _read_form_fields(ENTRY_FORM_FIELDS)
 
-    if (
-        base_missing
-        or objective_missing
-        or abilities_missing
-        or objective_invalid
-        or abilities_invalid
-    ):
+    if not name or not email or not _entry_form_is_valid(form_data):
         app.logger.warning(
             "Create entry validation failed for user=%s email=%s",
             name or "unknown",
             email or "",
         )
         flash("All fields must be completed with valid options", "error")
-        return redirect(url_for("index"))
+        return _see_other(url_for("index"))
 
-    too_long_comment_fields = _find_too_long_text_fields(
-        {
-            "Objective comments": objective_comment,
-            "Abilities comments": abilities_comment,
-            "Efficiency comments": efficiency_comment,
-            "Conduct comments": conduct_comment,
-            "General comments": general_comments,
-        }
-    )
+    too_long_comment_fields = _too_long_comment_labels(form_data, ENTRY_COMMENT_FIELD_LABELS)
     if too_long_comment_fields:
         app.logger.warning(
             "Create entry comment length validation failed for user=%s fields=%s",
@@ -986,73 +1678,54 @@ def create_entry() -> Response:
             f"Comment fields must be {COMMENT_MAX_LENGTH} characters or fewer: {', '.join(too_long_comment_fields)}",
             "error",
         )
-        return redirect(url_for("index"))
-
-    existing_entry = (
-        Entry.query.filter(func.lower(Entry.name) == name.lower()).first() if name else None
+        return _see_other(url_for("index"))
+
+    # A Core INSERT skips ORM unit-of-work bookkeeping for a row this request never reads back.
+    # The *_lower columns are set here because the @validates hook only runs on Entry instances.
+    insert_entry = (
+        insert(Entry)
+        .values(
+            name=name,
+            name_lower=name.lower(),
+            email=email,
+            manager_name=manager_name,
+            manager_name_lower=manager_name.lower(),
+            **form_data,
+        )
+        .returning(Entry.id)
     )
-    if existing_entry:
+    try:
+        entry_id = database.session.execute(insert_entry).scalar_one()
+        database.session.commit()
+    except IntegrityError:
+        # uq_entry_name_lower enforces one self assessment per user.
+        database.session.rollback()
         app.logger.warning(
-            "Create entry blocked because entry already exists for user=%s existing_entry_id=%s",
+            "Create entry blocked because entry already exists for user=%s",
             name or "unknown",
-            existing_entry.id,
         )
         flash(
             "You already have a self assessment. Please edit your existing one instead.",
             "error",
         )
-        return redirect(url_for("index"))
-
-    entry = Entry(  # type: ignore[call-arg]
-        name=name,
-        email=email,
-        manager_name=manager_name,
-        objective_rating=objective_rating,
-        objective_comment=objective_comment,
-        technical_rating=technical_rating,
-        project_rating=project_rating,
-        methodology_rating=methodology_rating,
-        abilities_comment=abilities_comment,
-        efficiency_collaboration=efficiency_collaboration,
-        efficiency_ownership=efficiency_ownership,
-        efficiency_resourcefulness=efficiency_resourcefulness,
-        efficiency_comment=efficiency_comment,
-        conduct_mutual_trust=conduct_mutual_trust,
-        conduct_proactivity=conduct_proactivity,
-        conduct_leadership=conduct_leadership,
-        conduct_comment=conduct_comment,
-        general_comments=general_comments,
-        feedback_received=feedback_received,
-    )
-    database.session.add(entry)
-    database.session.commit()
+        return _see_other(url_for("index"))
     app.logger.info(
         "Entry created entry_id=%s owner=%s manager=%s status=%s",
-        entry.id,
-        entry.name,
-        entry.manager_name or "",
-        entry.workflow_status or STATUS_CREATED,
+        entry_id,
+        name,
+        manager_name or "",
+        STATUS_CREATED,
     )
     flash("Entry created", "success")
-    return redirect(url_for("index"))
+    return _see_other(url_for("index"))
 
 
 @app.route("/entries/<int:entry_id>/edit", methods=["GET", "POST"])
 @login_required
 def edit_entry(entry_id: int) -> str | Response:
     """Edit an existing entry."""
-    entry = Entry.query.get_or_404(entry_id)
-
-    session_user = session.get("user", {})
-    if not _can_access_entry(entry, session_user):
-        app.logger.warning(
-            "Edit entry denied entry_id=%s requester=%s owner=%s",
-            entry.id,
-            session_user.get("name") or "unknown",
-            entry.name,
-        )
-        flash("You are not allowed to access this entry", "error")
-        return redirect(url_for("index"))
+    session_user = g.user
+    entry = _owned_entry_or_404(entry_id, session_user, "Edit entry")
 
     # Check workflow status - only allow editing if created
     workflow_status = entry.workflow_status or STATUS_CREATED
@@ -1063,88 +1736,23 @@ def edit_entry(entry_id: int) -> str | Response:
             workflow_status,
             session_user.get("name") or "unknown",
         )
-        if workflow_status == STATUS_FINALIZED:
-            flash("Cannot edit this self-assessment because it has been finalized with manager.", "error")
-        elif workflow_status == STATUS_SUBMITTED:
-            flash("Cannot edit this self-assessment because it has been submitted to the program manager.", "error")
-        elif workflow_status == STATUS_APPROVED:
-            flash("Cannot edit this self-assessment because it has been approved by the program manager.", "error")
-        else:
-            flash("Cannot edit this self-assessment at this stage.", "error")
-        return redirect(url_for("index"))
+        flash(_locked_entry_message("edit", workflow_status), "error")
+        return _redirect_after_request(url_for("index"))
 
     if request.method == "POST":
-        name = entry.name
-        email = entry.email
         manager_name = session_user.get("manager_name") or entry.manager_name
-        objective_rating = request.form.get("objective_rating", "").strip()
-        objective_comment = request.form.get("objective_comment", "").strip()
-        technical_rating = request.form.get("technical_rating", "").strip()
-        project_rating = request.form.get("project_rating", "").strip()
-        methodology_rating = request.form.get("methodology_rating", "").strip()
-        abilities_comment = request.form.get("abilities_comment", "").strip()
-        efficiency_collaboration = request.form.get("efficiency_collaboration", "").strip()
-        efficiency_ownership = request.form.get("efficiency_ownership", "").strip()
-        efficiency_resourcefulness = request.form.get("efficiency_resourcefulness", "").strip()
-        efficiency_comment = request.form.get("efficiency_comment", "").strip()
-        conduct_mutual_trust = request.form.get("conduct_mutual_trust", "").strip()
-        conduct_proactivity = request.form.get("conduct_proactivity", "").strip()
-        conduct_leadership = request.form.get("conduct_leadership", "").strip()
-        conduct_comment = request.form.get("conduct_comment", "").strip()
-        general_comments = request.form.get("general_comments", "").strip()
-        feedback_received = request.form.get("feedback_received", "").strip()
-
-        objective_missing = not objective_rating or not objective_comment
-        abilities_missing = (
-            not technical_rating
-            or not project_rating
-            or not methodology_rating
-            or not abilities_comment
-            or not efficiency_collaboration
-            or not efficiency_ownership
-            or not efficiency_resourcefulness
-            or not efficiency_comment
-            or not conduct_mutual_trust
-            or not conduct_proactivity
-            or not conduct_leadership
-            or not conduct_comment
-            or not general_comments
-            or not feedback_received
-        )
-        objective_invalid = not _validate_choice(objective_rating, OBJECTIVE_CHOICES)
-        abilities_invalid = not all(
-            _validate_choice(val, ABILITY_CHOICES)
-            for val in (
-                technical_rating,
-                project_rating,
-                methodology_rating,
-                efficiency_collaboration,
-                efficiency_ownership,
-                efficiency_resourcefulness,
-                conduct_mutual_trust,
-                conduct_proactivity,
-                conduct_leadership,
-            )
-        )
+        form_data = _read_form_fields(ENTRY_FORM_FIELDS)
 
-        if objective_missing or abilities_missing or objective_invalid or abilities_invalid:
+        if not _entry_form_is_valid(form_data):
             app.logger.warning(
                 "Edit entry validation failed entry_id=%s requester=%s",
                 entry.id,
                 session_user.get("name") or "unknown",
             )
             flash("All fields must be completed with valid options", "error")
-            return redirect(url_for("edit_entry", entry_id=entry_id))
+            return _see_other(url_for("edit_entry", entry_id=entry_id))
 
-        too_long_comment_fields = _find_too_long_text_fields(
-            {
-                "Objective comments": objective_comment,
-                "Abilities comments": abilities_comment,
-                "Efficiency comments": efficiency_comment,
-                "Conduct comments": conduct_comment,
-                "General comments": general_comments,
-            }
-        )
+        too_long_comment_fields = _too_long_comment_labels(form_data, ENTRY_COMMENT_FIELD_LABELS)
         if too_long_comment_fields:
             app.logger.warning(
                 "Edit entry comment length validation failed entry_id=%s requester=%s fields=%s",
@@ -1156,37 +1764,33 @@ def edit_entry(entry_id: int) -> str | Response:
                 f"Comment fields must be {COMMENT_MAX_LENGTH} characters or fewer: {', '.join(too_long_comment_fields)}",
                 "error",
             )
-            return redirect(url_for("edit_entry", entry_id=entry_id))
-
-        entry.name = name
-        entry.email = email
-        entry.manager_name = manager_name
-        entry.objective_rating = objective_rating
-        entry.objective_comment = objective_comment
-        entry.technical_rating = technical_rating
-        entry.project_rating = project_rating
-        entry.methodology_rating = methodology_rating
-        entry.abilities_comment = abilities_comment
-        entry.efficiency_collaboration = efficiency_collaboration
-        entry.efficiency_ownership = efficiency_ownership
-        entry.efficiency_resourcefulness = efficiency_resourcefulness
-        entry.efficiency_comment = efficiency_comment
-        entry.conduct_mutual_trust = conduct_mutual_trust
-        entry.conduct_proactivity = conduct_proactivity
-        entry.conduct_leadership = conduct_leadership
-        entry.conduct_comment = conduct_comment
-        entry.general_comments = general_comments
-        entry.feedback_received = feedback_received
+            return _see_other(url_for("edit_entry", entry_id=entry_id))
+
+        # One UPDATE of the submitted values; the status guard stops a save from landing on
+        # an entry the manager finalized after this form was loaded.
+        saved = database.session.execute(
+            update(Entry)
+            .where(Entry.id == entry.id, Entry.workflow_status == STATUS_CREATED)
+            .values(
+                manager_name=manager_name,
+                manager_name_lower=(manager_name or "").lower(),
+                **form_data,
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
         database.session.commit()
+        if not saved:
+            flash("Cannot edit this self-assessment at this stage.", "error")
+            return _see_other(url_for("index"))
         app.logger.info(
             "Entry updated entry_id=%s owner=%s updated_by=%s status=%s",
             entry.id,
             entry.name,
             session_user.get("name") or "unknown",
-            entry.workflow_status or STATUS_CREATED,
+            STATUS_CREATED,
         )
         flash("Entry updated", "success")
-        return redirect(url_for("index"))
+        return _see_other(url_for("index"))
 
     return render_template(
         "edit.html",
@@ -1200,17 +1804,8 @@ def edit_entry(entry_id: int) -> str | Response:
 @login_required
 def delete_entry(entry_id: int) -> Response:
     """Delete an existing entry."""
-    entry = Entry.query.get_or_404(entry_id)
-    session_user = session.get("user", {})
-    if not _can_access_entry(entry, session_user):
-        app.logger.warning(
-            "Delete entry denied entry_id=%s requester=%s owner=%s",
-            entry.id,
-            session_user.get("name") or "unknown",
-            entry.name,
-        )
-        flash("You are not allowed to access this entry", "error")
-        return redirect(url_for("index"))
+    session_user = g.user
+    entry = _owned_entry_or_404(entry_id, session_user, "Delete entry")
 
     # Check workflow status - only allow deleting if created.
     # Temporary test mode can also allow deleting in any workflow status.
@@ -1223,15 +1818,8 @@ def delete_entry(entry_id: int) -> Response:
             workflow_status,
             session_user.get("name") or "unknown",
         )
-        if workflow_status == STATUS_FINALIZED:
-            flash("Cannot delete this self-assessment because it has been finalized with manager.", "error")
-        elif workflow_status == STATUS_SUBMITTED:
-            flash("Cannot delete this self-assessment because it has been submitted to the program manager.", "error")
-        elif workflow_status == STATUS_APPROVED:
-            flash("Cannot delete this self-assessment because it has been approved by the program manager.", "error")
-        else:
-            flash("Cannot delete this self-assessment at this stage.", "error")
-        return redirect(url_for("index"))
+        flash(_locked_entry_message("delete", workflow_status), "error")
+        return _see_other(url_for("index"))
 
     if can_delete_any_status_for_testing and workflow_status != STATUS_CREATED:
         flash(
@@ -1250,7 +1838,7 @@ def delete_entry(entry_id: int) -> Response:
         session_user.get("name") or "unknown",
     )
     flash("Entry deleted", "success")
-    return redirect(url_for("index"))
+    return _see_other(url_for("index"))
 
 
 @app.route("/entries/<int:entry_id>/finalize", methods=["POST"])
@@ -1258,17 +1846,8 @@ def delete_entry(entry_id: int) -> Response:
 def finalize_entry(entry_id: int) -> Response:
     """Open manager final-assessment form without changing workflow state."""
 
-    entry = Entry.query.get_or_404(entry_id)
-    session_user = session.get("user", {})
-    if not _can_manage_entry(entry, session_user):
-        app.logger.warning(
-            "Finalize form access denied entry_id=%s requester=%s manager=%s",
-            entry.id,
-            session_user.get("name") or "unknown",
-            entry.manager_name or "",
-        )
-        flash("Only the manager can finalize this entry.", "error")
-        return redirect(url_for("index"))
+    session_user = g.user
+    entry = _managed_entry_or_404(entry_id, session_user, "Finalize form access")
 
     if entry.workflow_status in (STATUS_SUBMITTED, STATUS_APPROVED):
         app.logger.info(
@@ -1278,7 +1857,7 @@ def finalize_entry(entry_id: int) -> Response:
             session_user.get("name") or "unknown",
         )
         flash("This entry cannot be edited after submission to the program manager.", "error")
-        return redirect(url_for("index"))
+        return _see_other(url_for("index"))
 
     app.logger.info(
         "Finalize form opened entry_id=%s owner=%s manager=%s status=%s",
@@ -1288,7 +1867,7 @@ def finalize_entry(entry_id: int) -> Response:
         entry.workflow_status or STATUS_CREATED,
     )
     flash("Open manager assessment form and press 'Save Final Assessment' to finalize.", "info")
-    return redirect(url_for("edit_manager_entry", entry_id=entry.id))
+    return _see_other(url_for("edit_manager_entry", entry_id=entry.id))
 
 
 @app.route("/entries/<int:entry_id>/edit_manager", methods=["GET", "POST"])
@@ -1296,18 +1875,8 @@ def finalize_entry(entry_id: int) -> Response:
 def edit_manager_entry(entry_id: int) -> str | Response:
     """Edit manager comments for an entry (manager only)."""
 
-    entry = Entry.query.get_or_404(entry_id)
-    session_user = session.get("user", {})
-
-    if not _can_manage_entry(entry, session_user):
-        app.logger.warning(
-            "Manager edit denied entry_id=%s requester=%s manager=%s",
-            entry.id,
-            session_user.get("name") or "unknown",
-            entry.manager_name or "",
-        )
-        flash("You are not allowed to access this entry.", "error")
-        return redirect(url_for("index"))
+    session_user = g.user
+    entry = _managed_entry_or_404(entry_id, session_user, "Manager edit")
 
     if entry.workflow_status in (STATUS_SUBMITTED, STATUS_APPROVED):
         app.logger.info(
@@ -1317,24 +1886,12 @@ def edit_manager_entry(entry_id: int) -> str | Response:
             session_user.get("name") or "unknown",
         )
         flash("This entry cannot be edited after submission to the program manager.", "error")
-        return redirect(url_for("index"))
+        return _redirect_after_request(url_for("index"))
 
     if request.method == "POST":
         # Editable manager fields
-        manager_objective_comment = request.form.get("manager_objective_comment", "").strip()
-        manager_abilities_comment = request.form.get("manager_abilities_comment", "").strip()
-        manager_efficiency_comment = request.form.get("manager_efficiency_comment", "").strip()
-        goals_2026 = request.form.get("goals_2026", "").strip()
-        manager_general_comments = request.form.get("manager_general_comments", "").strip()
-
-        # Validate only the editable manager fields
-        manager_fields_missing = (
-            not manager_objective_comment
-            or not manager_abilities_comment
-            or not manager_efficiency_comment
-            or not goals_2026
-            or not manager_general_comments
-        )
+        form_data = _read_form_fields(MANAGER_COMMENT_FIELD_LABELS)
+        manager_fields_missing = not all(form_data.values())
 
         if manager_fields_missing:
             app.logger.warning(
@@ -1343,17 +1900,9 @@ def edit_manager_entry(entry_id: int) -> str | Response:
                 session_user.get("name") or "unknown",
             )
             flash("All manager fields must be completed", "error")
-            return redirect(url_for("edit_manager_entry", entry_id=entry_id))
+            return _see_other(url_for("edit_manager_entry", entry_id=entry_id))
 
-        too_long_comment_fields = _find_too_long_text_fields(
-            {
-                "Manager objective comments": manager_objective_comment,
-                "Manager abilities comments": manager_abilities_comment,
-                "Manager efficiency comments": manager_efficiency_comment,
-                "Goals 2026": goals_2026,
-                "Manager general comments": manager_general_comments,
-            }
-        )
+        too_long_comment_fields = _too_long_comment_labels(form_data, MANAGER_COMMENT_FIELD_LABELS)
         if too_long_comment_fields:
             app.logger.warning(
                 "Manager edit comment length validation failed entry_id=%s requester=%s fields=%s",
@@ -1365,14 +1914,11 @@ def edit_manager_entry(entry_id: int) -> str | Response:
                 f"Comment fields must be {COMMENT_MAX_LENGTH} characters or fewer: {', '.join(too_long_comment_fields)}",
                 "error",
             )
-            return redirect(url_for("edit_manager_entry", entry_id=entry_id))
+            return _see_other(url_for("edit_manager_entry", entry_id=entry_id))
 
         previous_status = entry.workflow_status or STATUS_CREATED
-        entry.manager_objective_comment = manager_objective_comment
-        entry.manager_abilities_comment = manager_abilities_comment
-        entry.manager_efficiency_comment = manager_efficiency_comment
-        entry.goals_2026 = goals_2026
-        entry.manager_general_comments = manager_general_comments
+        for field, value in form_data.items():
+            setattr(entry, field, value)
         entry.workflow_status = STATUS_FINALIZED
         entry.program_manager_name = session_user.get("program_manager_name") or ""
         database.session.commit()
@@ -1395,10 +1941,10 @@ def edit_manager_entry(entry_id: int) -> str | Response:
                 exc,
             )
             flash("Final assessment saved, but summary email could not be sent.", "warning")
-            return redirect(url_for("index"))
+            return _see_other(url_for("index"))
 
         flash("Final assessment saved and summary email sent.", "success")
-        return redirect(url_for("index"))
+        return _see_other(url_for("index"))
 
     return render_template(
         "final_edit.html",
@@ -1408,25 +1954,58 @@ def edit_manager_entry(entry_id: int) -> str | Response:
     )
 
 
+def _transition_entry_status(
+    entry_id: int, requester_filter: Any, from_status: str, to_status: str
+) -> tuple[str, str] | None:
+    """Move an allowed entry from ``from_status`` to ``to_status`` in one UPDATE, else None."""
+
+    # Misses leave the row untouched; the caller then loads the entry to explain why.
+    if not g.user_name:
+        return None
+    row = database.session.execute(
+        update(Entry)
+        .where(Entry.id == entry_id, requester_filter, Entry.workflow_status == from_status)
+        .values(workflow_status=to_status)
+        .returning(Entry.name, Entry.program_manager_name)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if row is None:
+        # Even a no-op UPDATE holds SQLite's write lock; release it before the fallback reads.
+        database.session.rollback()
+        return None
+    database.session.commit()
+    return row.name, row.program_manager_name
+
+
 @app.route("/entries/<int:entry_id>/submit", methods=["POST"])
 @login_required
 def submit_entry(entry_id: int) -> Response:
     """Submit a finalized entry to the program manager."""
 
-    entry = Entry.query.get_or_404(entry_id)
-    session_user = session.get("user", {})
+    session_user = g.user
+    name = g.user_name
+    submitted = _transition_entry_status(
+        entry_id,
+        Entry.manager_name_lower == name.lower(),
+        STATUS_FINALIZED,
+        STATUS_SUBMITTED,
+    )
 
-    if not _can_manage_entry(entry, session_user):
-        app.logger.warning(
-            "Submit denied entry_id=%s requester=%s manager=%s",
-            entry.id,
-            session_user.get("name") or "unknown",
-            entry.manager_name or "",
-        )
-        flash("You are not allowed to submit this entry.", "error")
-        return redirect(url_for("index"))
+    if submitted is None:
+        entry = database.session.get(Entry, entry_id) or abort(404)
+
+        if not _can_manage_entry(entry, session_user):
+            app.logger.warning(
+                "Submit denied entry_id=%s requester=%s manager=%s",
+                entry.id,
+                session_user.get("name") or "unknown",
+                entry.manager_name or "",
+            )
+            flash("You are not allowed to submit this entry.", "error")
+            return _see_other(url_for("index"))
 
-    if entry.workflow_status != STATUS_FINALIZED:
+        # The requester is allowed, so the guarded UPDATE missed on the status; never retry
+        # the write here, the status may have changed concurrently.
         app.logger.info(
             "Submit blocked by status entry_id=%s status=%s requester=%s",
             entry.id,
@@ -1434,23 +2013,21 @@ def submit_entry(entry_id: int) -> Response:
             session_user.get("name") or "unknown",
         )
         flash("Only finalized entries can be submitted to the program manager.", "error")
-        return redirect(url_for("index"))
+        return _see_other(url_for("index"))
 
-    previous_status = entry.workflow_status or STATUS_CREATED
-    entry.workflow_status = STATUS_SUBMITTED
-    database.session.commit()
+    owner_name, program_manager_name = submitted
     app.logger.info(
         "Entry submitted to program manager entry_id=%s owner=%s submitted_by=%s status=%s->%s program_manager=%s",
-        entry.id,
-        entry.name,
+        entry_id,
+        owner_name,
         session_user.get("name") or "unknown",
-        previous_status,
-        entry.workflow_status,
-        entry.program_manager_name or "",
+        STATUS_FINALIZED,
+        STATUS_SUBMITTED,
+        program_manager_name or "",
     )
 
     flash("Entry submitted to program manager.", "success")
-    return redirect(url_for("index"))
+    return _see_other(url_for("index"))
 
 
 @app.route("/entries/<int:entry_id>/approve", methods=["POST"])
@@ -1458,20 +2035,30 @@ def submit_entry(entry_id: int) -> Response:
 def approve_entry(entry_id: int) -> Response:
     """Approve a submitted entry as program manager."""
 
-    entry = Entry.query.get_or_404(entry_id)
-    session_user = session.get("user", {})
+    session_user = g.user
+    name = g.user_name
+    approved = _transition_entry_status(
+        entry_id,
+        Entry.program_manager_name_lower == name.lower(),
+        STATUS_SUBMITTED,
+        STATUS_APPROVED,
+    )
 
-    if not _can_approve_entry(entry, session_user):
-        app.logger.warning(
-            "Approve denied entry_id=%s requester=%s program_manager=%s",
-            entry.id,
-            session_user.get("name") or "unknown",
-            entry.program_manager_name or "",
-        )
-        flash("You are not allowed to approve this entry.", "error")
-        return redirect(url_for("index"))
+    if approved is None:
+        entry = database.session.get(Entry, entry_id) or abort(404)
 
-    if entry.workflow_status != STATUS_SUBMITTED:
+        if not _can_approve_entry(entry, session_user):
+            app.logger.warning(
+                "Approve denied entry_id=%s requester=%s program_manager=%s",
+                entry.id,
+                session_user.get("name") or "unknown",
+                entry.program_manager_name or "",
+            )
+            flash("You are not allowed to approve this entry.", "error")
+            return _see_other(url_for("index"))
+
+        # The requester is allowed, so the guarded UPDATE missed on the status; never retry
+        # the write here, the status may have changed concurrently.
         app.logger.info(
             "Approve blocked by status entry_id=%s status=%s requester=%s",
             entry.id,
@@ -1479,21 +2066,18 @@ def approve_entry(entry_id: int) -> Response:
             session_user.get("name") or "unknown",
         )
         flash("Only submitted entries can be approved.", "error")
-        return redirect(url_for("index"))
+        return _see_other(url_for("index"))
 
-    previous_status = entry.workflow_status or STATUS_CREATED
-    entry.workflow_status = STATUS_APPROVED
-    database.session.commit()
     app.logger.info(
         "Entry approved entry_id=%s owner=%s approved_by=%s status=%s->%s",
-        entry.id,
-        entry.name,
+        entry_id,
+        approved[0],
         session_user.get("name") or "unknown",
-        previous_status,
-        entry.workflow_status,
+        STATUS_SUBMITTED,
+        STATUS_APPROVED,
     )
     flash("Entry approved by program manager.", "success")
-    return redirect(url_for("index"))
+    return _see_other(url_for("index"))
 
 
 @app.route("/login")
@@ -1508,13 +2092,8 @@ def login() -> Response:
     if not CLIENT_SECRET:
         app.logger.warning("Login initiated without AZURE_AD_CLIENT_SECRET configured")
         flash("AZURE_AD_CLIENT_SECRET not set; login will fail.", "error")
-    session["state"] = str(uuid.uuid4())
-    auth_url = _build_msal_app().get_authorization_request_url(
-        scopes=SCOPES,
-        state=session["state"],
-        redirect_uri=_redirect_uri(),
-    )
-    return redirect(auth_url)
+    session["state"] = secrets.token_urlsafe(16)
+    return redirect(_authorization_request_url(session["state"]))
 
 
 @app.route(REDIRECT_PATH)
@@ -1540,7 +2119,8 @@ def authorized() -> Response:
         return redirect(url_for("index"))
 
     code = request.args.get("code")
-    result = _build_msal_app().acquire_token_by_authorization_code(
+    token_cache = msal.SerializableTokenCache()
+    result = _msal_client(token_cache).acquire_token_by_authorization_code(
         code=code,
         scopes=SCOPES,
         redirect_uri=_redirect_uri(),
@@ -1556,8 +2136,10 @@ def authorized() -> Response:
 
     claims = result.get("id_token_claims", {})
     access_token = result.get("access_token", "")
-    manager_name, program_manager_name = _fetch_manager_hierarchy(access_token or "")
-    direct_reports = _fetch_direct_reports(access_token or "")
+    _store_user_token_cache(claims.get("oid") or "", token_cache)
+    (manager_name, program_manager_name), direct_reports = _fetch_sign_in_directory(
+        claims.get("oid") or "", access_token or ""
+    )
     user_name = claims.get("name")
     user_email = claims.get("preferred_username")
 
@@ -1611,15 +2193,18 @@ def authorized() -> Response:
 def logout() -> Response:
     """Clear local session and sign out of Azure AD."""
 
-    session_user = session.get("user", {})
+    session_user = g.user
     app.logger.info(
         "Logout initiated by user=%s oid=%s",
         session_user.get("name") or "unknown",
         session_user.get("oid") or "",
     )
+    _MANAGER_HIERARCHY_CACHE.pop(session_user.get("oid") or "", None)
+    with _TOKEN_CACHES_LOCK:
+        _TOKEN_CACHES.pop(session_user.get("oid") or "", None)
     session.clear()
     post_logout = url_for("index", _external=True)
-    return redirect(f"{AUTHORITY}/oauth2/v2.0/logout?post_logout_redirect_uri={post_logout}")
+    return redirect(f"{LOGOUT_URL}?{urlencode({'post_logout_redirect_uri': post_logout})}")
 
 
 if __name__ == "__main__":